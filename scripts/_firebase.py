@@ -0,0 +1,30 @@
+import firebase_admin
+from firebase_admin import credentials, firestore, firestore_async, auth
+
+# Initialize Firebase Admin SDK once for every script that imports this module
+_cred = credentials.Certificate("service-account.json")
+try:
+    _app = firebase_admin.initialize_app(_cred, {
+        'projectId': 'tricykol-b2296',
+    })
+except ValueError:
+    # App already initialized
+    _app = firebase_admin.get_app()
+
+# Shared Firestore client (reuses a single gRPC channel)
+db = firestore.client()
+
+# Shared asyncio Firestore client, created on first use since most scripts
+# only need the sync client
+_async_db = None
+
+def get_async_db():
+    """
+    Return the shared asyncio Firestore client, creating it on first call.
+    """
+    global _async_db
+    if _async_db is None:
+        _async_db = firestore_async.client()
+    return _async_db
+
+__all__ = ['db', 'get_async_db', 'auth']
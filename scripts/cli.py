@@ -0,0 +1,174 @@
+import asyncio
+import csv
+import uuid
+import click
+
+# Script modules are imported inside each command so that commands which do
+# not touch Firestore (e.g. search) don't need the service account.
+
+
+@click.group()
+def cli():
+    """
+    Tricykol utility scripts.
+
+    Run several operations in one process (e.g. with the bulk commands) to
+    pay for interpreter startup and Firebase initialization only once.
+    """
+
+
+@cli.command()
+@click.option('--passenger', required=True, help='Passenger ID')
+@click.option('--pickup_lat', type=float, required=True, help='Pickup latitude')
+@click.option('--pickup_lng', type=float, required=True, help='Pickup longitude')
+@click.option('--dropoff_lat', type=float, required=True, help='Dropoff latitude')
+@click.option('--dropoff_lng', type=float, required=True, help='Dropoff longitude')
+@click.option('--name', required=True, help='Passenger name')
+@click.option('--phone', required=True, help='Passenger phone number')
+@click.option('--guardian-phone', help='Guardian phone number to notify (optional)')
+@click.option('--guardian-name', help="Guardian name (default: 'Guardian')")
+@click.option('--guardian-relationship', help="Guardian relationship to the passenger (default: 'Guardian')")
+def booking(passenger, pickup_lat, pickup_lng, dropoff_lat, dropoff_lng, name, phone,
+            guardian_phone, guardian_name, guardian_relationship):
+    """Create a booking from a passenger."""
+    from create_booking import create_booking
+
+    result = asyncio.run(create_booking(
+        passenger, pickup_lat, pickup_lng, dropoff_lat, dropoff_lng,
+        name, phone, guardian_phone, guardian_name, guardian_relationship
+    ))
+    click.echo(result)
+
+
+@cli.command()
+@click.argument('csv_file', type=click.File('r'), default='-')
+def bookings(csv_file):
+    """
+    Create many bookings from a CSV file (or stdin).
+
+    Columns: passenger,pickup_lat,pickup_lng,dropoff_lat,dropoff_lng,name,phone,
+    and optionally guardian_phone,guardian_name,guardian_relationship
+    """
+    from create_booking import bulk_create_bookings
+
+    rows = [
+        (
+            row['passenger'],
+            float(row['pickup_lat']),
+            float(row['pickup_lng']),
+            float(row['dropoff_lat']),
+            float(row['dropoff_lng']),
+            row['name'],
+            row['phone'],
+            row.get('guardian_phone') or None,
+            row.get('guardian_name') or None,
+            row.get('guardian_relationship') or None,
+        )
+        for row in csv.DictReader(csv_file)
+    ]
+    result = bulk_create_bookings(rows)
+    summary = {k: v for k, v in result.items() if k not in ('bookingIds', 'errors')}
+    summary['created'] = len(result.get('bookingIds', []))
+    click.echo(summary)
+
+
+@cli.command()
+@click.option('--lat', type=float, required=True, help='Latitude of the search center')
+@click.option('--lng', type=float, required=True, help='Longitude of the search center')
+@click.option('--radius', type=float, default=1000, show_default=True, help='Search radius in meters')
+@click.option('--status', default='pending', show_default=True,
+              help="Booking status to match ('any' for every status)")
+def nearby(lat, lng, radius, status):
+    """Find bookings with a pickup location near a point."""
+    from find_bookings import find_bookings_near
+
+    result = find_bookings_near(lat, lng, radius, None if status == 'any' else status)
+    if not result['success']:
+        click.echo(result)
+        return
+    for booking in result['bookings']:
+        click.echo(f"  {booking['id']}  {booking['distance']} m  {booking.get('passengerName')}")
+
+
+@cli.command('group-booking')
+@click.option('--passenger', required=True, help='Passenger ID')
+@click.option('--pickup_lat', type=float, required=True, help='Pickup latitude')
+@click.option('--pickup_lng', type=float, required=True, help='Pickup longitude')
+@click.option('--dropoff_lat', type=float, required=True, help='Dropoff latitude')
+@click.option('--dropoff_lng', type=float, required=True, help='Dropoff longitude')
+@click.option('--passengers', type=click.Choice(['2', '3']), required=True,
+              help='Number of passengers (2 or 3)')
+@click.option('--name', required=True, help='Main passenger name')
+@click.option('--phone', required=True, help='Main passenger phone number')
+@click.option('--guardian-phone', help='Guardian phone number to notify (optional)')
+@click.option('--guardian-name', help="Guardian name (default: 'Guardian')")
+@click.option('--guardian-relationship', help="Guardian relationship to the passenger (default: 'Guardian')")
+def group_booking(passenger, pickup_lat, pickup_lng, dropoff_lat, dropoff_lng, passengers,
+                  name, phone, guardian_phone, guardian_name, guardian_relationship):
+    """Create a group booking from a passenger."""
+    from create_group_booking import create_group_booking
+
+    result = asyncio.run(create_group_booking(
+        passenger, pickup_lat, pickup_lng, dropoff_lat, dropoff_lng, int(passengers),
+        name, phone, guardian_phone, guardian_name, guardian_relationship
+    ))
+    click.echo(result)
+
+
+@cli.command()
+@click.option('--phone', required=True, help='Passenger phone number')
+def passenger(phone):
+    """Create a test passenger account."""
+    from create_passenger import create_passenger
+
+    click.echo(create_passenger(phone))
+
+
+@cli.command()
+@click.argument('phones_file', type=click.File('r'), default='-')
+def passengers(phones_file):
+    """Create test passenger accounts, one phone number per line (file or stdin)."""
+    from create_passenger import create_passengers_bulk
+
+    phone_numbers = [line.strip() for line in phones_file if line.strip()]
+    click.echo(create_passengers_bulk(phone_numbers))
+
+
+@cli.command()
+@click.option('--phone', required=True, help='Phone number in E.164 format (e.g., +639670575500)')
+@click.option('--name', default='Test Driver', show_default=True, help='Driver name')
+def driver(phone, name):
+    """Create a verified driver account and wallet."""
+    from create_verified_driver import create_verified_driver
+
+    click.echo(create_verified_driver(phone, name))
+
+
+@cli.command()
+@click.option('--query', required=True, help='The search query.')
+@click.option('--language', default='en', show_default=True, help='Language for results.')
+@click.option('--proximity', help='Proximity coordinates (e.g., -73.990593,40.740121).')
+@click.option('--session_token', help='Session token for billing.')
+def search(query, language, proximity, session_token):
+    """Search for places using the Mapbox Searchbox API."""
+    from mapbox_search import search_mapbox
+
+    # Generate a session token if not provided
+    session_token = session_token or str(uuid.uuid4())
+
+    results = search_mapbox(query, language, proximity, session_token)
+
+    if results:
+        click.echo(f"Search results for '{query}':")
+        for place in results:
+            click.echo(f"  Name: {place.get('name')}")
+            click.echo(f"  Full Address: {place.get('full_address')}")
+            click.echo(f"  Place Formatted: {place.get('place_formatted')}")
+            click.echo(f"  Mapbox ID: {place.get('mapbox_id')}")
+            click.echo("-" * 20)
+    else:
+        click.echo(f"No results found for '{query}' or an error occurred.")
+
+
+if __name__ == "__main__":
+    cli()
@@ -1,96 +1,101 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
-from datetime import datetime, timezone, timedelta
-import uuid
-import argparse
+from firebase_admin import firestore
 import random
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from _firebase import db, get_async_db
+from geohash_utils import geohash_int, geohash_str, geohash_int_batch, geohash_str_batch
 
-# Initialize Firebase Admin SDK
-cred = credentials.Certificate("service-account.json")
-try:
-    app = firebase_admin.initialize_app(cred, {
-        'projectId': 'tricykol-b2296',
-    })
-except ValueError:
-    # App already initialized
-    app = firebase_admin.get_app()
+# Firestore allows at most 500 writes per batch
+BATCH_SIZE = 500
 
-# Initialize Firestore client
-db = firestore.client()
+# Number of batches committed in parallel when bulk creating bookings
+MAX_WORKERS = 40
 
-def create_booking(passenger_id: str, pickup_lat: float, pickup_lng: float, dropoff_lat: float, dropoff_lng: float):
+def _build_booking_data(booking_id: str, passenger_id: str, passenger_name: str, passenger_phone: str,
+                        guardian_phone: str, pickup_lat: float, pickup_lng: float,
+                        dropoff_lat: float, dropoff_lng: float, geohash: str, geohash52: int,
+                        estimated_distance: int, estimated_duration: int, estimated_fare: int,
+                        guardian_name: str = None, guardian_relationship: str = None):
+    """
+    Build the booking document for a passenger and pickup/dropoff locations.
+    """
+    booking_data = {
+        'id': booking_id,
+        'passengerId': passenger_id,
+        'passengerName': passenger_name,
+        'passengerPhone': passenger_phone,
+        'pickupLocation': {
+            'coordinates': firestore.GeoPoint(pickup_lat, pickup_lng),
+            'name': f"Pickup at {pickup_lat:.6f}, {pickup_lng:.6f}",
+            'geohash': geohash,
+            'geohash52': geohash52
+        },
+        'dropoffLocation': {
+            'coordinates': firestore.GeoPoint(dropoff_lat, dropoff_lng),
+            'name': f"Dropoff at {dropoff_lat:.6f}, {dropoff_lng:.6f}"
+        },
+        'status': 'pending',
+        'estimatedDistance': estimated_distance,
+        'estimatedDuration': estimated_duration,
+        'estimatedFare': estimated_fare,
+        'driverId': None,
+        'createdAt': firestore.SERVER_TIMESTAMP
+    }
+    
+    # Add guardian notification info if available
+    if guardian_phone:
+        booking_data['guardianNotification'] = {
+            'name': guardian_name or 'Guardian',
+            'phoneNumber': guardian_phone,
+            'relationship': guardian_relationship or 'Guardian',
+            'notified': False
+        }
+    
+    return booking_data
+
+async def create_booking(passenger_id: str, pickup_lat: float, pickup_lng: float, dropoff_lat: float, dropoff_lng: float,
+                         passenger_name: str, passenger_phone: str, guardian_phone: str = None,
+                         guardian_name: str = None, guardian_relationship: str = None):
     """
     Create a booking from a passenger with specified pickup and dropoff locations.
     
+    The passenger details are taken from the caller rather than read from
+    Firestore, so creating a booking is a single write. For many bookings use
+    bulk_create_bookings instead.
+    
     Args:
         passenger_id: The ID of the passenger creating the booking
         pickup_lat: Latitude of pickup location
         pickup_lng: Longitude of pickup location
         dropoff_lat: Latitude of dropoff location
         dropoff_lng: Longitude of dropoff location
+        passenger_name: Name of the passenger
+        passenger_phone: Phone number of the passenger
+        guardian_phone: Phone number of the passenger's guardian to notify (optional)
+        guardian_name: Name of the guardian (defaults to 'Guardian')
+        guardian_relationship: Guardian's relationship to the passenger (defaults to 'Guardian')
     """
     try:
-        # Verify passenger exists
-        passenger_ref = db.collection('passengers').document(passenger_id)
-        passenger = passenger_ref.get()
-        
-        if not passenger.exists:
-            return {
-                'success': False,
-                'error': f'Passenger with ID {passenger_id} does not exist'
-            }
+        # Let Firestore generate the booking ID (auto IDs spread writes evenly)
+        booking_ref = get_async_db().collection('bookings').document()
+        booking_id = booking_ref.id
         
-        passenger_data = passenger.to_dict()
+        # Generate the geohash (string and 52-bit integer) for the pickup location
+        geohash = geohash_str(pickup_lat, pickup_lng)
+        geohash52 = geohash_int(pickup_lat, pickup_lng)
         
-        # Generate a unique ID for the booking
-        booking_id = str(uuid.uuid4())
-        
-        # Get current time
-        now = datetime.now(timezone.utc)
-        
-        # Generate a geohash for the pickup location (simplified version)
-        # In a real app, you'd use a proper geohash library
-        geohash = f"{int(pickup_lat * 1000)}-{int(pickup_lng * 1000)}"
+        booking_data = _build_booking_data(
+            booking_id, passenger_id, passenger_name, passenger_phone, guardian_phone,
+            pickup_lat, pickup_lng, dropoff_lat, dropoff_lng,
+            geohash, geohash52,
+            random.randint(1000, 5000),  # Random distance in meters
+            random.randint(300, 1200),   # Random duration in seconds
+            random.randint(25, 100),     # Random fare in pesos
+            guardian_name, guardian_relationship
+        )
         
         # Create booking document
-        booking_data = {
-            'id': booking_id,
-            'passengerId': passenger_id,
-            'passengerName': passenger_data.get('name', 'Unknown Passenger'),
-            'passengerPhone': passenger_data.get('phoneNumber', 'Unknown'),
-            'pickupLocation': {
-                'latitude': pickup_lat,
-                'longitude': pickup_lng,
-                'name': f"Pickup at {pickup_lat:.6f}, {pickup_lng:.6f}",
-                'geohash': geohash
-            },
-            'dropoffLocation': {
-                'latitude': dropoff_lat,
-                'longitude': dropoff_lng,
-                'name': f"Dropoff at {dropoff_lat:.6f}, {dropoff_lng:.6f}"
-            },
-            'status': 'pending',
-            'dateTime': firestore.SERVER_TIMESTAMP,
-            'estimatedDistance': random.randint(1000, 5000),  # Random distance in meters
-            'estimatedDuration': random.randint(300, 1200),   # Random duration in seconds
-            'estimatedFare': random.randint(25, 100),         # Random fare in pesos
-            'driverId': None,
-            'createdAt': firestore.SERVER_TIMESTAMP,
-            'updatedAt': firestore.SERVER_TIMESTAMP
-        }
-        
-        # Add guardian notification info if available
-        if 'guardian' in passenger_data and passenger_data['guardian'].get('phoneNumber'):
-            booking_data['guardianNotification'] = {
-                'name': passenger_data['guardian'].get('name', 'Guardian'),
-                'phoneNumber': passenger_data['guardian'].get('phoneNumber'),
-                'relationship': passenger_data['guardian'].get('relationship', 'Guardian'),
-                'notified': False
-            }
-        
-        # Create booking document
-        booking_ref = db.collection('bookings').document(booking_id)
-        booking_ref.set(booking_data)
+        await booking_ref.set(booking_data)
         print(f"Created booking with ID: {booking_id}")
         
         return {
@@ -106,23 +111,99 @@ def create_booking(passenger_id: str, pickup_lat: float, pickup_lng: float, drop
             'error': str(e)
         }
 
-if __name__ == "__main__":
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Create a booking from a passenger')
-    parser.add_argument('--passenger', type=str, required=True, help='Passenger ID')
-    parser.add_argument('--pickup_lat', type=float, required=True, help='Pickup latitude')
-    parser.add_argument('--pickup_lng', type=float, required=True, help='Pickup longitude')
-    parser.add_argument('--dropoff_lat', type=float, required=True, help='Dropoff latitude')
-    parser.add_argument('--dropoff_lng', type=float, required=True, help='Dropoff longitude')
+def bulk_create_bookings(rows: list):
+    """
+    Create many bookings at once, e.g. for seeding test data.
     
-    args = parser.parse_args()
+    Geohashes are computed for all pickups in one vectorized pass and bookings
+    are written in batches of 500 committed in parallel. Each batch commits
+    independently, so a failed batch does not undo the others; the result lists
+    the IDs that were committed and the error of every batch that was not.
     
-    # Create booking with the specified parameters
-    result = create_booking(
-        args.passenger,
-        args.pickup_lat,
-        args.pickup_lng,
-        args.dropoff_lat,
-        args.dropoff_lng
-    )
-    print(result) 
\ No newline at end of file
+    Args:
+        rows: List of (passenger_id, pickup_lat, pickup_lng, dropoff_lat, dropoff_lng,
+              passenger_name, passenger_phone, guardian_phone, guardian_name,
+              guardian_relationship) tuples; the guardian fields may be None
+    """
+    try:
+        if not rows:
+            return {
+                'success': True,
+                'bookingIds': [],
+                'message': 'No bookings to create'
+            }
+        
+        (passenger_ids, pickup_lats, pickup_lngs, dropoff_lats, dropoff_lngs,
+         passenger_names, passenger_phones, guardian_phones, guardian_names,
+         guardian_relationships) = zip(*rows)
+        
+        # Generate geohashes for all pickup locations at once
+        geohashes = geohash_str_batch(pickup_lats, pickup_lngs)
+        geohashes52 = geohash_int_batch(pickup_lats, pickup_lngs).tolist()
+        
+        # Sample the random estimates for all bookings at once (same ranges as create_booking)
+        rng = np.random.default_rng()
+        distances = rng.integers(1000, 5001, size=len(rows), dtype=np.int32).tolist()
+        durations = rng.integers(300, 1201, size=len(rows), dtype=np.int32).tolist()
+        fares = rng.integers(25, 101, size=len(rows), dtype=np.int32).tolist()
+        
+        # (batch, booking IDs written by that batch)
+        batches = []
+        batch, batch_ids = db.batch(), []
+        for i in range(len(rows)):
+            booking_ref = db.collection('bookings').document()
+            booking_id = booking_ref.id
+            booking_data = _build_booking_data(
+                booking_id, passenger_ids[i], passenger_names[i], passenger_phones[i], guardian_phones[i],
+                pickup_lats[i], pickup_lngs[i], dropoff_lats[i], dropoff_lngs[i],
+                geohashes[i], geohashes52[i],
+                distances[i], durations[i], fares[i],
+                guardian_names[i], guardian_relationships[i]
+            )
+            batch.set(booking_ref, booking_data)
+            batch_ids.append(booking_id)
+            
+            if len(batch_ids) == BATCH_SIZE:
+                batches.append((batch, batch_ids))
+                batch, batch_ids = db.batch(), []
+        if batch_ids:
+            batches.append((batch, batch_ids))
+        
+        # Commit the batches in parallel, keeping track of which ones landed
+        booking_ids = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(batch.commit): batch_ids for batch, batch_ids in batches}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    booking_ids.extend(futures[future])
+                except Exception as e:
+                    errors.append({
+                        'bookingIds': futures[future],
+                        'error': str(e)
+                    })
+        print(f"Created {len(booking_ids)} bookings in {len(batches) - len(errors)} batches")
+        for error in errors:
+            print(f"Error committing batch of {len(error['bookingIds'])} bookings: {error['error']}")
+        
+        if errors:
+            return {
+                'success': False,
+                'bookingIds': booking_ids,
+                'errors': errors,
+                'error': f'{len(errors)} of {len(batches)} batches failed to commit'
+            }
+        
+        return {
+            'success': True,
+            'bookingIds': booking_ids,
+            'message': 'Bookings created successfully'
+        }
+        
+    except Exception as e:
+        print(f"Error creating bookings: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
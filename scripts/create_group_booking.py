@@ -1,22 +1,7 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
-from datetime import datetime, timezone, timedelta
-import uuid
-import argparse
 import random
-
-# Initialize Firebase Admin SDK
-cred = credentials.Certificate("service-account.json")
-try:
-    app = firebase_admin.initialize_app(cred, {
-        'projectId': 'tricykol-b2296',
-    })
-except ValueError:
-    # App already initialized
-    app = firebase_admin.get_app()
-
-# Initialize Firestore client
-db = firestore.client()
+from _firebase import get_async_db
+from create_booking import _build_booking_data
+from geohash_utils import geohash_int, geohash_str
 
 def calculate_fare(distance_meters: int, passenger_count: int):
     """
@@ -39,8 +24,10 @@ def calculate_fare(distance_meters: int, passenger_count: int):
     total_fare = base_fare + additional_fare + additional_passenger_fare
     return round(total_fare)
 
-def create_group_booking(passenger_id: str, pickup_lat: float, pickup_lng: float, 
-                        dropoff_lat: float, dropoff_lng: float, passenger_count: int):
+async def create_group_booking(passenger_id: str, pickup_lat: float, pickup_lng: float, 
+                              dropoff_lat: float, dropoff_lng: float, passenger_count: int,
+                              passenger_name: str, passenger_phone: str, guardian_phone: str = None,
+                              guardian_name: str = None, guardian_relationship: str = None):
     """
     Create a booking for multiple passengers
     
@@ -51,6 +38,11 @@ def create_group_booking(passenger_id: str, pickup_lat: float, pickup_lng: float
         dropoff_lat: Latitude of dropoff location
         dropoff_lng: Longitude of dropoff location
         passenger_count: Number of passengers (2 or 3)
+        passenger_name: Name of the main passenger
+        passenger_phone: Phone number of the main passenger
+        guardian_phone: Phone number of the passenger's guardian to notify (optional)
+        guardian_name: Name of the guardian (defaults to 'Guardian')
+        guardian_relationship: Guardian's relationship to the passenger (defaults to 'Guardian')
     """
     try:
         # Validate passenger count
@@ -60,23 +52,13 @@ def create_group_booking(passenger_id: str, pickup_lat: float, pickup_lng: float
                 'error': 'Passenger count must be 2 or 3'
             }
 
-        # Verify passenger exists
-        passenger_ref = db.collection('passengers').document(passenger_id)
-        passenger = passenger_ref.get()
-        
-        if not passenger.exists:
-            return {
-                'success': False,
-                'error': f'Passenger with ID {passenger_id} does not exist'
-            }
-        
-        passenger_data = passenger.to_dict()
-        
-        # Generate booking ID
-        booking_id = str(uuid.uuid4())
+        # Let Firestore generate the booking ID (auto IDs spread writes evenly)
+        booking_ref = get_async_db().collection('bookings').document()
+        booking_id = booking_ref.id
         
-        # Generate simplified geohash
-        geohash = f"{int(pickup_lat * 1000)}-{int(pickup_lng * 1000)}"
+        # Generate the geohash (string and 52-bit integer) for the pickup location
+        geohash = geohash_str(pickup_lat, pickup_lng)
+        geohash52 = geohash_int(pickup_lat, pickup_lng)
         
         # Generate random distance (1-5 km in meters)
         estimated_distance = random.randint(1000, 5000)
@@ -84,47 +66,20 @@ def create_group_booking(passenger_id: str, pickup_lat: float, pickup_lng: float
         # Calculate fare based on distance and passenger count
         estimated_fare = calculate_fare(estimated_distance, passenger_count)
         
-        # Create booking document
-        booking_data = {
-            'id': booking_id,
-            'passengerId': passenger_id,
-            'passengerName': passenger_data.get('name', 'Unknown Passenger'),
-            'passengerPhone': passenger_data.get('phoneNumber', 'Unknown'),
-            'passengerCount': passenger_count,
-            'pickupLocation': {
-                'latitude': pickup_lat,
-                'longitude': pickup_lng,
-                'name': f"Pickup at {pickup_lat:.6f}, {pickup_lng:.6f}",
-                'geohash': geohash
-            },
-            'dropoffLocation': {
-                'latitude': dropoff_lat,
-                'longitude': dropoff_lng,
-                'name': f"Dropoff at {dropoff_lat:.6f}, {dropoff_lng:.6f}"
-            },
-            'status': 'pending',
-            'dateTime': firestore.SERVER_TIMESTAMP,
-            'estimatedDistance': estimated_distance,
-            'estimatedDuration': random.randint(300, 1200),  # 5-20 minutes in seconds
-            'estimatedFare': estimated_fare,
-            'isGroupBooking': True,
-            'driverId': None,
-            'createdAt': firestore.SERVER_TIMESTAMP,
-            'updatedAt': firestore.SERVER_TIMESTAMP
-        }
-        
-        # Add guardian notification info if available
-        if 'guardian' in passenger_data and passenger_data['guardian'].get('phoneNumber'):
-            booking_data['guardianNotification'] = {
-                'name': passenger_data['guardian'].get('name', 'Guardian'),
-                'phoneNumber': passenger_data['guardian'].get('phoneNumber'),
-                'relationship': passenger_data['guardian'].get('relationship', 'Guardian'),
-                'notified': False
-            }
+        # Create booking document (same layout as a single booking, plus group fields)
+        booking_data = _build_booking_data(
+            booking_id, passenger_id, passenger_name, passenger_phone, guardian_phone,
+            pickup_lat, pickup_lng, dropoff_lat, dropoff_lng,
+            geohash, geohash52,
+            estimated_distance,
+            random.randint(300, 1200),  # 5-20 minutes in seconds
+            estimated_fare,
+            guardian_name, guardian_relationship
+        )
+        booking_data['passengerCount'] = passenger_count
+        booking_data['isGroupBooking'] = True
         
-        # Create booking document
-        booking_ref = db.collection('bookings').document(booking_id)
-        booking_ref.set(booking_data)
+        await booking_ref.set(booking_data)
         print(f"Created group booking with ID: {booking_id}")
         print(f"Passenger count: {passenger_count}")
         print(f"Estimated fare: ₱{estimated_fare}")
@@ -143,27 +98,3 @@ def create_group_booking(passenger_id: str, pickup_lat: float, pickup_lng: float
             'success': False,
             'error': str(e)
         }
-
-if __name__ == "__main__":
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Create a group booking from a passenger')
-    parser.add_argument('--passenger', type=str, required=True, help='Passenger ID')
-    parser.add_argument('--pickup_lat', type=float, required=True, help='Pickup latitude')
-    parser.add_argument('--pickup_lng', type=float, required=True, help='Pickup longitude')
-    parser.add_argument('--dropoff_lat', type=float, required=True, help='Dropoff latitude')
-    parser.add_argument('--dropoff_lng', type=float, required=True, help='Dropoff longitude')
-    parser.add_argument('--passengers', type=int, required=True, choices=[2, 3], 
-                       help='Number of passengers (2 or 3)')
-    
-    args = parser.parse_args()
-    
-    # Create booking with the specified parameters
-    result = create_group_booking(
-        args.passenger,
-        args.pickup_lat,
-        args.pickup_lng,
-        args.dropoff_lat,
-        args.dropoff_lng,
-        args.passengers
-    )
-    print(result) 
\ No newline at end of file
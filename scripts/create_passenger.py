@@ -1,45 +1,46 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
+import threading
+from firebase_admin import firestore
 from datetime import datetime, timezone
-import uuid
+from _firebase import db
 
-# Initialize Firebase Admin SDK
-cred = credentials.Certificate("service-account.json")
-app = firebase_admin.initialize_app(cred, {
-    'projectId': 'tricykol-b2296',
-})
+# Attempts per passenger write before the BulkWriter gives up (its default)
+MAX_WRITE_ATTEMPTS = 15
 
-# Initialize Firestore client
-db = firestore.client()
+def _build_passenger_data(passenger_id: str, phone_number: str):
+    """
+    Build the passenger document for the given ID and phone number.
+    """
+    passenger_data = {
+        'id': passenger_id,
+        'name': 'Test Passenger',  # You can modify this
+        'email': None,  # Optional
+        'phoneNumber': phone_number,
+        'sex': 'Male',  # You can modify this
+        'dateOfBirth': datetime(1990, 1, 1, tzinfo=timezone.utc),  # You can modify this
+        # Guardian/parent/contact person (optional)
+        'guardian': {
+            'name': 'Test Guardian',  # You can modify this
+            'relationship': 'Parent',  # You can modify this
+            'phoneNumber': '09670575500'  # You can modify this
+        },
+        'createdAt': firestore.SERVER_TIMESTAMP,
+        'updatedAt': firestore.SERVER_TIMESTAMP
+    }
+    
+    return passenger_data
 
 def create_passenger(phone_number: str):
     """
     Create a passenger account with the given phone number.
     """
     try:
-        # Generate a unique ID for the passenger
-        passenger_id = str(uuid.uuid4())
+        # Let Firestore generate the passenger ID (auto IDs spread writes evenly)
+        passenger_ref = db.collection('passengers').document()
+        passenger_id = passenger_ref.id
         
-        # Create passenger document
-        passenger_data = {
-            'id': passenger_id,
-            'name': 'Test Passenger',  # You can modify this
-            'email': None,  # Optional
-            'phoneNumber': phone_number,
-            'sex': 'Male',  # You can modify this
-            'dateOfBirth': datetime(1990, 1, 1, tzinfo=timezone.utc),  # You can modify this
-            # Guardian/parent/contact person (optional)
-            'guardian': {
-                'name': 'Test Guardian',  # You can modify this
-                'relationship': 'Parent',  # You can modify this
-                'phoneNumber': '09670575500'  # You can modify this
-            },
-            'createdAt': firestore.SERVER_TIMESTAMP,
-            'updatedAt': firestore.SERVER_TIMESTAMP
-        }
+        passenger_data = _build_passenger_data(passenger_id, phone_number)
         
         # Create passenger document
-        passenger_ref = db.collection('passengers').document(passenger_id)
         passenger_ref.set(passenger_data)
         print(f"Created passenger account with ID: {passenger_id}")
         
@@ -56,7 +57,74 @@ def create_passenger(phone_number: str):
             'error': str(e)
         }
 
-if __name__ == "__main__":
-    # Create passenger with the specified phone number
-    result = create_passenger("09670575500")
-    print(result)
+def create_passengers_bulk(phone_numbers: list):
+    """
+    Create a passenger account for each of the given phone numbers.
+    
+    Writes go through a Firestore BulkWriter, which sends them in parallel
+    with rate limiting and retries failed writes automatically. The BulkWriter
+    never raises for writes that fail for good, so results and failures are
+    collected through its callbacks.
+    """
+    passenger_ids = []
+    errors = []
+    lock = threading.Lock()
+    
+    def on_write_result(reference, result, bulk_writer):
+        with lock:
+            passenger_ids.append(reference.id)
+    
+    def on_write_error(failure, bulk_writer):
+        # Retry like the default handler, then record the write as failed
+        if failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        with lock:
+            errors.append({
+                'passengerId': failure.operation.reference.id,
+                'error': failure.message
+            })
+        return False
+    
+    bulk_writer = db.bulk_writer()
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+    try:
+        for phone_number in phone_numbers:
+            passenger_ref = db.collection('passengers').document()
+            passenger_data = _build_passenger_data(passenger_ref.id, phone_number)
+            bulk_writer.set(passenger_ref, passenger_data)
+        bulk_writer.flush()
+        
+    except Exception as e:
+        print(f"Error creating passengers: {str(e)}")
+        # close() flushes again; don't let a second failure hide this one
+        try:
+            bulk_writer.close()
+        except Exception:
+            pass
+        return {
+            'success': False,
+            'passengerIds': passenger_ids,
+            'errors': errors,
+            'error': str(e)
+        }
+    
+    bulk_writer.close()
+    
+    print(f"Created {len(passenger_ids)} passenger accounts")
+    for error in errors:
+        print(f"Error creating passenger {error['passengerId']}: {error['error']}")
+    
+    if errors:
+        return {
+            'success': False,
+            'passengerIds': passenger_ids,
+            'errors': errors,
+            'error': f'{len(errors)} of {len(phone_numbers)} passengers failed to write'
+        }
+    
+    return {
+        'success': True,
+        'passengerIds': passenger_ids,
+        'message': 'Passenger accounts created successfully'
+    }
@@ -1,17 +1,14 @@
-import firebase_admin
-from firebase_admin import credentials, firestore, auth
+from firebase_admin import firestore
+from google.api_core.exceptions import Aborted
 from datetime import datetime, timezone
-import uuid
-import argparse
+import time
+from _firebase import db, auth
 
-# Initialize Firebase Admin SDK
-cred = credentials.Certificate("service-account.json")
-app = firebase_admin.initialize_app(cred, {
-    'projectId': 'tricykol-b2296',
-})
+# Number of attempts for the driver/wallet batch commit before giving up
+MAX_COMMIT_ATTEMPTS = 3
 
-# Initialize Firestore client
-db = firestore.client()
+# Delay before the first retry in seconds, doubled after each aborted attempt
+RETRY_BASE_DELAY = 0.2
 
 def create_verified_driver(phone_number: str, name: str = "Test Driver"):
     """
@@ -61,11 +58,6 @@ def create_verified_driver(phone_number: str, name: str = "Test Driver"):
             'updatedAt': firestore.SERVER_TIMESTAMP
         }
         
-        # Create driver document with the same ID as the Auth UID
-        driver_ref = db.collection('drivers').document(driver_id)
-        driver_ref.set(driver_data)
-        print(f"Created verified driver with ID: {driver_id}")
-        
         # Create wallet for the driver (as per requirements)
         wallet_data = {
             'driverId': driver_id,
@@ -74,14 +66,26 @@ def create_verified_driver(phone_number: str, name: str = "Test Driver"):
             'updatedAt': firestore.SERVER_TIMESTAMP
         }
         
-        # Create wallet document
-        wallet_ref = db.collection('wallets').document(driver_id)
-        wallet_ref.set(wallet_data)
-        print(f"Created wallet for driver with initial balance of 300 pesos")
+        # Create driver (same ID as the Auth UID) and wallet documents in a
+        # single atomic batch so a driver never exists without a wallet
+        for attempt in range(1, MAX_COMMIT_ATTEMPTS + 1):
+            batch = db.batch()
+            batch.set(db.collection('drivers').document(driver_id), driver_data)
+            batch.set(db.collection('wallets').document(driver_id), wallet_data)
+            try:
+                batch.commit()
+                break
+            except Aborted:
+                if attempt == MAX_COMMIT_ATTEMPTS:
+                    raise
+                print(f"Batch commit aborted, retrying ({attempt}/{MAX_COMMIT_ATTEMPTS})")
+                time.sleep(RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        print(f"Created verified driver with ID: {driver_id}")
+        print("Created wallet for driver with initial balance of 300 pesos")
         
         # Set custom claims for the user to identify as a driver
         auth.set_custom_user_claims(driver_id, {'role': 'driver', 'verified': True})
-        print(f"Set custom claims for user: role=driver, verified=true")
+        print("Set custom claims for user: role=driver, verified=true")
         
         return {
             'success': True,
@@ -96,15 +100,3 @@ def create_verified_driver(phone_number: str, name: str = "Test Driver"):
             'success': False,
             'error': str(e)
         }
-
-if __name__ == "__main__":
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Create a verified driver account')
-    parser.add_argument('--phone', type=str, required=True, help='Phone number in E.164 format (e.g., +639670575500)')
-    parser.add_argument('--name', type=str, default="Test Driver", help='Driver name')
-    
-    args = parser.parse_args()
-    
-    # Create verified driver with the specified phone number
-    result = create_verified_driver(args.phone, args.name)
-    print(result)
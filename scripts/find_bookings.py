@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from _firebase import db
+from geohash_utils import distance_m, geohash_ranges
+
+def _query_range(lo: int, hi: int, status: str = None):
+    """
+    Fetch the bookings whose pickup geohash falls within [lo, hi],
+    optionally only those with the given status.
+    """
+    query = db.collection('bookings')
+    if status:
+        query = query.where('status', '==', status)
+    query = (query
+             .where('pickupLocation.geohash52', '>=', lo)
+             .where('pickupLocation.geohash52', '<=', hi))
+    return list(query.stream())
+
+def find_bookings_near(lat: float, lng: float, radius_m: float, status: str = 'pending'):
+    """
+    Find bookings whose pickup location is within radius_m of a point.
+
+    The circle is covered by a few 52-bit geohash ranges which are queried in
+    parallel on pickupLocation.geohash52, so only
+    bookings in the surrounding cells are read instead of the whole collection.
+    When status is given it is part of each range query, so bookings with other
+    statuses (e.g. old completed rides) are not read at all. This needs a
+    composite index on bookings: status ASC, pickupLocation.geohash52 ASC.
+    Without a status, every booking in the covered cells is read.
+    Very close to the poles the cover degrades to a full collection scan (see
+    geohash_ranges).
+
+    Args:
+        lat: Latitude of the center
+        lng: Longitude of the center
+        radius_m: Search radius in meters
+        status: Only return bookings with this status (None for any status)
+    """
+    try:
+        ranges = geohash_ranges(lat, lng, radius_m)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            results = list(executor.map(lambda r: _query_range(*r, status), ranges))
+
+        bookings = []
+        for snapshot in (s for snapshots in results for s in snapshots):
+            booking = snapshot.to_dict()
+            booking['id'] = snapshot.id
+
+            point = booking.get('pickupLocation', {}).get('coordinates')
+            if point is None:
+                continue
+            distance = distance_m(lat, lng, point.latitude, point.longitude)
+            if distance <= radius_m:
+                booking['distance'] = round(distance)
+                bookings.append(booking)
+
+        bookings.sort(key=lambda b: b['distance'])
+        print(f"Found {len(bookings)} bookings within {radius_m} meters")
+
+        return {
+            'success': True,
+            'bookings': bookings
+        }
+
+    except Exception as e:
+        print(f"Error finding bookings: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
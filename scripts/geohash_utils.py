@@ -0,0 +1,241 @@
+import math
+import numpy as np
+
+# Standard geohash base32 alphabet (same as ngeohash used by the app)
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Number of bits kept in the integer geohash (26 bits per axis, Redis convention)
+GEOHASH_BITS = 52
+
+# Degrees-to-32-bit-cell scale factors, precomputed for the hot encode path
+_LAT_SCALE = (1 << 32) / 180.0
+_LNG_SCALE = (1 << 32) / 360.0
+
+# Largest 32-bit cell index (reached only at lat=90 / lng=180)
+_MAX_CELL = 0xFFFFFFFF
+
+
+def _interleave(x: int) -> int:
+    """
+    Spread the lower 32 bits of x so that bit i moves to bit 2*i (Morton code).
+    """
+    x &= 0xFFFFFFFF
+    x = (x | (x << 16)) & 0x0000FFFF0000FFFF
+    x = (x | (x << 8)) & 0x00FF00FF00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F0F0F0F0F
+    x = (x | (x << 2)) & 0x3333333333333333
+    x = (x | (x << 1)) & 0x5555555555555555
+    return x
+
+
+def _quantize(lat: float, lng: float):
+    """
+    Map a coordinate to its 32-bit latitude and longitude cell indices.
+    """
+    return (min(int((lat + 90.0) * _LAT_SCALE), _MAX_CELL),
+            min(int((lng + 180.0) * _LNG_SCALE), _MAX_CELL))
+
+
+def _morton(lat: float, lng: float) -> int:
+    """
+    Quantize a coordinate to 32 bits per axis and interleave into a 64-bit code.
+    Longitude takes the odd (higher) bits so the result matches a standard geohash.
+    """
+    lat_u, lng_u = _quantize(lat, lng)
+    return _interleave(lat_u) | (_interleave(lng_u) << 1)
+
+
+def geohash_int(lat: float, lng: float) -> int:
+    """
+    Compute the 52-bit interleaved integer geohash of a coordinate.
+
+    Nearby points share a common prefix, so the value can be range-scanned
+    in Firestore (e.g. where('pickupLocation.geohash52', '>=', lo)).
+
+    Args:
+        lat: Latitude in degrees
+        lng: Longitude in degrees
+
+    Returns:
+        The geohash as an integer in [0, 2^52)
+    """
+    return _morton(lat, lng) >> (64 - GEOHASH_BITS)
+
+
+def geohash_str(lat: float, lng: float, precision: int = 11) -> str:
+    """
+    Compute the base32 geohash string of a coordinate.
+
+    Args:
+        lat: Latitude in degrees
+        lng: Longitude in degrees
+        precision: Number of characters (max 12)
+
+    Returns:
+        The geohash string, compatible with ngeohash.encode on the app side
+    """
+    return _base32(_morton(lat, lng), precision)
+
+
+def _base32(code: int, precision: int) -> str:
+    """
+    Encode the top 5 * precision bits of a 64-bit Morton code as base32.
+    """
+    if not 0 < precision <= 12:
+        raise ValueError(f"precision must be between 1 and 12, got {precision}")
+    chars = []
+    for i in range(precision):
+        shift = 64 - 5 * (i + 1)
+        chars.append(BASE32[(code >> shift) & 0x1F])
+    return "".join(chars)
+
+
+def _interleave_batch(x: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _interleave over a uint64 array.
+    """
+    x = x & np.uint64(0xFFFFFFFF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x3333333333333333)
+    x = (x | (x << np.uint64(1))) & np.uint64(0x5555555555555555)
+    return x
+
+
+def _morton_batch(lats, lngs) -> np.ndarray:
+    """
+    Vectorized _morton over arrays of latitudes and longitudes.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    lats_u = np.minimum((lats + 90.0) * _LAT_SCALE, _MAX_CELL).astype(np.uint64)
+    lngs_u = np.minimum((lngs + 180.0) * _LNG_SCALE, _MAX_CELL).astype(np.uint64)
+    return _interleave_batch(lats_u) | (_interleave_batch(lngs_u) << np.uint64(1))
+
+
+def geohash_int_batch(lats, lngs) -> np.ndarray:
+    """
+    Compute 52-bit integer geohashes for many coordinates at once.
+
+    Args:
+        lats: Sequence or array of latitudes in degrees
+        lngs: Sequence or array of longitudes in degrees
+
+    Returns:
+        A uint64 array of geohashes, same values as geohash_int per point
+    """
+    return _morton_batch(lats, lngs) >> np.uint64(64 - GEOHASH_BITS)
+
+
+def geohash_str_batch(lats, lngs, precision: int = 11) -> list:
+    """
+    Compute base32 geohash strings for many coordinates at once.
+
+    Args:
+        lats: Sequence or array of latitudes in degrees
+        lngs: Sequence or array of longitudes in degrees
+        precision: Number of characters (max 12)
+
+    Returns:
+        A list of geohash strings, same values as geohash_str per point
+    """
+    return [_base32(code, precision) for code in _morton_batch(lats, lngs).tolist()]
+
+
+# Mean Earth radius in meters (same sphere as distance_m)
+EARTH_RADIUS_M = 6371000.0
+
+# Length of one degree of latitude on that sphere
+_METERS_PER_DEGREE = 2 * math.pi * EARTH_RADIUS_M / 360.0
+
+# Relative margin on the circle's extent when sizing cells, so points right at
+# the radius are not lost to floating point and quantization error
+_COVER_MARGIN = 1.01
+
+
+def distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Great-circle (haversine) distance between two points in meters.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def _step_for_radius(lat: float, radius_m: float) -> int:
+    """
+    Pick the finest precision (bits per axis) whose cells are at least as tall
+    and wide as the search circle's extent from its center, so a 3x3 block of
+    cells around the center covers the whole circle.
+    """
+    # Angular radius, and the half-spans of the circle in latitude/longitude
+    delta = radius_m / EARTH_RADIUS_M
+    lat_extent = math.degrees(delta) * _COVER_MARGIN
+    sin_ratio = math.sin(delta) / max(math.cos(math.radians(lat)), 1e-12)
+    if sin_ratio >= 1:
+        # The circle contains a pole and spans every longitude
+        return 0
+    lng_extent = math.degrees(math.asin(sin_ratio)) * _COVER_MARGIN
+
+    for step in range(GEOHASH_BITS // 2, 0, -1):
+        cell_height = 180.0 / (1 << step)
+        cell_width = 360.0 / (1 << step)
+        if cell_height >= lat_extent and cell_width >= lng_extent:
+            return step
+    return 0
+
+
+def geohash_ranges(lat: float, lng: float, radius_m: float) -> list:
+    """
+    Compute the 52-bit geohash ranges covering a circle around a point.
+
+    Uses the Redis GEORADIUS approach: the cell containing the point and its
+    8 neighbours at a precision where cells are at least as large as the
+    circle's latitude and longitude extent on the EARTH_RADIUS_M sphere.
+    Each range can be queried with
+    where('pickupLocation.geohash52', '>=', lo).where('pickupLocation.geohash52', '<=', hi);
+    results still need to be filtered by actual distance.
+
+    Circles get wider in longitude towards the poles. When the circle spans
+    too many degrees of longitude (e.g. 5 km around latitude 89.99), this
+    degrades to the single full range [0, 2^52), i.e. a scan of every document.
+
+    Args:
+        lat: Latitude of the center in degrees
+        lng: Longitude of the center in degrees
+        radius_m: Search radius in meters
+
+    Returns:
+        A sorted list of non-overlapping inclusive (lo, hi) ranges
+    """
+    step = _step_for_radius(lat, radius_m)
+    if step == 0:
+        return [(0, (1 << GEOHASH_BITS) - 1)]
+
+    lat_u, lng_u = _quantize(lat, lng)
+    lat_idx = lat_u >> (32 - step)
+    lng_idx = lng_u >> (32 - step)
+    cells_per_axis = 1 << step
+    shift = GEOHASH_BITS - 2 * step
+
+    ranges = set()
+    for d_lat in (-1, 0, 1):
+        cell_lat = lat_idx + d_lat
+        if not 0 <= cell_lat < cells_per_axis:
+            continue
+        for d_lng in (-1, 0, 1):
+            cell_lng = (lng_idx + d_lng) % cells_per_axis
+            cell = _interleave(cell_lat) | (_interleave(cell_lng) << 1)
+            ranges.add((cell << shift, ((cell + 1) << shift) - 1))
+
+    # Merge adjacent cells into a single range
+    merged = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
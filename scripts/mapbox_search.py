@@ -1,7 +1,7 @@
+import orjson
 import requests
+import requests_cache
 import os
-import argparse
-import uuid
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -10,6 +10,41 @@ load_dotenv()
 # Get Mapbox access token
 MAPBOX_ACCESS_TOKEN = os.getenv("MAPBOX_ACCESS_TOKEN")
 
+# Seconds a cached search result stays fresh when Mapbox sends no Cache-Control
+CACHE_EXPIRE_AFTER = 60
+
+# The memory backend is an unbounded dict that only drops expired entries when
+# they are looked up again, so purge it every CACHE_PURGE_INTERVAL searches and
+# clear it entirely if it still holds more than CACHE_MAX_ENTRIES responses.
+CACHE_PURGE_INTERVAL = 100
+CACHE_MAX_ENTRIES = 1000
+
+# Shared HTTP session so the TCP/TLS connection is reused across searches.
+# Responses are kept in an in-memory cache, so repeated queries (common while
+# typing) skip the network, and stale entries are revalidated with
+# If-None-Match / If-Modified-Since.
+_session = requests_cache.CachedSession(
+    'mapbox',
+    backend='memory',
+    expire_after=CACHE_EXPIRE_AFTER,
+    cache_control=True,
+)
+_session.headers['Accept'] = 'application/json'
+_searches_since_purge = 0
+
+def _purge_cache():
+    """
+    Keep the in-memory response cache bounded in long-lived processes.
+    """
+    global _searches_since_purge
+    _searches_since_purge += 1
+    if _searches_since_purge < CACHE_PURGE_INTERVAL:
+        return
+    _searches_since_purge = 0
+    _session.cache.delete(expired=True)
+    if len(_session.cache.responses) > CACHE_MAX_ENTRIES:
+        _session.cache.clear()
+
 def search_mapbox(query: str, language: str = "en", proximity: str = None, session_token: str = None):
     """
     Searches for places using the Mapbox Searchbox API and extracts location data.
@@ -24,18 +59,23 @@ def search_mapbox(query: str, language: str = "en", proximity: str = None, sessi
         A list of dictionaries, each containing data for a suggested place, or None if an error occurs.
     """
     base_url = "https://api.mapbox.com/search/searchbox/v1/suggest"
-    url = f"{base_url}?q={query}&language={language}&access_token={MAPBOX_ACCESS_TOKEN}"
+    params = {
+        "q": query,
+        "language": language,
+        "access_token": MAPBOX_ACCESS_TOKEN,
+    }
 
     if proximity:
-        url += f"&proximity={proximity}"
+        params["proximity"] = proximity
     if session_token:
-        url += f"&session_token={session_token}"
+        params["session_token"] = session_token
 
+    _purge_cache()
 
     try:
-        response = requests.get(url)
+        response = _session.get(base_url, params=params)
         response.raise_for_status()  # Raise an exception for bad status codes
-        data = response.json()
+        data = orjson.loads(response.content)
 
         places = []
         for suggestion in data.get("suggestions", []):
@@ -51,29 +91,6 @@ def search_mapbox(query: str, language: str = "en", proximity: str = None, sessi
     except requests.exceptions.RequestException as e:
         print(f"Error during API request: {e}")
         return None
-
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Search for places using Mapbox Searchbox API.")
-    parser.add_argument("--query", type=str, required=True, help="The search query.")
-    parser.add_argument("--language", type=str, default="en", help="Language for results (default: en).")
-    parser.add_argument("--proximity", type=str, help="Proximity coordinates (e.g., -73.990593,40.740121).")
-    parser.add_argument("--session_token", type=str, help="Session token for billing.")
-
-    args = parser.parse_args()
-
-    # Generate a session token if not provided
-    session_token = args.session_token or str(uuid.uuid4())
-
-    results = search_mapbox(args.query, args.language, args.proximity, session_token)
-
-    if results:
-        print(f"Search results for '{args.query}':")
-        for place in results:
-            print(f"  Name: {place.get('name')}")
-            print(f"  Full Address: {place.get('full_address')}")
-            print(f"  Place Formatted: {place.get('place_formatted')}")
-            print(f"  Mapbox ID: {place.get('mapbox_id')}")
-            print("-" * 20)
-    else:
-        print(f"No results found for '{args.query}' or an error occurred.")
+    except orjson.JSONDecodeError as e:
+        print(f"Error decoding API response: {e}")
+        return None
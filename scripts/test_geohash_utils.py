@@ -0,0 +1,106 @@
+import math
+import random
+
+import pytest
+
+from geohash_utils import (
+    BASE32,
+    EARTH_RADIUS_M,
+    distance_m,
+    geohash_int,
+    geohash_int_batch,
+    geohash_ranges,
+    geohash_str,
+    geohash_str_batch,
+)
+
+
+def test_geohash_str_known_vector():
+    assert geohash_str(57.64911, 10.40744) == "u4pruydqqvj"
+
+
+def test_geohash_int_matches_string_prefix():
+    # The top 50 of the 52 bits are the first 10 base32 characters
+    bits = ''.join(f"{BASE32.index(c):05b}" for c in "u4pruydqqv")
+    assert geohash_int(57.64911, 10.40744) >> 2 == int(bits, 2)
+
+
+def test_geohash_extremes():
+    assert geohash_str(-90, -180) == "0" * 11
+    assert geohash_str(90, 180) == "z" * 11
+    assert geohash_int(90, 180) == (1 << 52) - 1
+
+
+def test_geohash_str_rejects_bad_precision():
+    with pytest.raises(ValueError):
+        geohash_str(0, 0, precision=13)
+    with pytest.raises(ValueError):
+        geohash_str(0, 0, precision=0)
+
+
+def test_batch_matches_scalar():
+    rng = random.Random(1234)
+    lats = [rng.uniform(-90, 90) for _ in range(2000)] + [90.0, -90.0, 0.0]
+    lngs = [rng.uniform(-180, 180) for _ in range(2000)] + [180.0, -180.0, 0.0]
+
+    assert geohash_int_batch(lats, lngs).tolist() == [geohash_int(a, b) for a, b in zip(lats, lngs)]
+    assert geohash_str_batch(lats, lngs) == [geohash_str(a, b) for a, b in zip(lats, lngs)]
+
+
+def _destination(lat, lng, distance, bearing):
+    """Point reached from (lat, lng) after distance meters along a great circle."""
+    phi = math.radians(lat)
+    angle = distance / EARTH_RADIUS_M
+    phi2 = math.asin(math.sin(phi) * math.cos(angle)
+                     + math.cos(phi) * math.sin(angle) * math.cos(bearing))
+    lambda2 = math.radians(lng) + math.atan2(
+        math.sin(bearing) * math.sin(angle) * math.cos(phi),
+        math.cos(angle) - math.sin(phi) * math.sin(phi2))
+    return math.degrees(phi2), (math.degrees(lambda2) + 540) % 360 - 180
+
+
+def _assert_covered(lat, lng, radius_m, rng, samples=200):
+    ranges = geohash_ranges(lat, lng, radius_m)
+    for i in range(samples):
+        # Half the points sit right on the circle, the rest anywhere inside it
+        distance = radius_m * (1 - 1e-9) if i % 2 else rng.uniform(0, radius_m)
+        point = _destination(lat, lng, distance, rng.uniform(0, 2 * math.pi))
+        if distance_m(lat, lng, *point) > radius_m:
+            continue
+        code = geohash_int(*point)
+        assert any(lo <= code <= hi for lo, hi in ranges), (lat, lng, radius_m, point)
+
+
+@pytest.mark.parametrize("radius_m", [100, 500, 2000, 10000])
+def test_geohash_ranges_cover_points_inside_radius(radius_m):
+    rng = random.Random(radius_m)
+    for _ in range(50):
+        _assert_covered(rng.uniform(-80, 80), rng.uniform(-180, 180), radius_m, rng)
+
+
+@pytest.mark.parametrize("step", range(6, 20))
+def test_geohash_ranges_cover_radius_just_below_cell_size(step):
+    # Radii just below a cell height are where an undersized cover shows up
+    meters_per_degree = 2 * math.pi * EARTH_RADIUS_M / 360
+    radius_m = 180 / 2 ** step * meters_per_degree * 0.9999
+    rng = random.Random(step)
+    for _ in range(20):
+        _assert_covered(rng.uniform(-80, 80), rng.uniform(-180, 180), radius_m, rng)
+
+
+@pytest.mark.parametrize("lat, lng, radius_m", [
+    (15.6446, 120.5755, 9783),
+    (70.7758, -120.2346, 12886),
+])
+def test_geohash_ranges_cover_reported_cases(lat, lng, radius_m):
+    _assert_covered(lat, lng, radius_m, random.Random(0), samples=2000)
+
+
+def test_geohash_ranges_are_sorted_and_disjoint():
+    ranges = geohash_ranges(15.7, 120.58, 3000)
+    for (_, prev_hi), (lo, _) in zip(ranges, ranges[1:]):
+        assert prev_hi + 1 < lo
+
+
+def test_geohash_ranges_degrade_to_full_range_near_poles():
+    assert geohash_ranges(89.99, 0, 5000) == [(0, (1 << 52) - 1)]
@@ -13,7 +13,7 @@ import { GeoPoint } from '@react-native-firebase/firestore';
  * @property {string} passengerPhone - Phone number of the passenger
  * @property {Location} pickupLocation - Pickup location details
  * @property {Location} dropoffLocation - Dropoff location details
- * @property {Date} dateTime - When the booking was created
+ * @property {Date} [dateTime] - When the booking was created (legacy, same as createdAt)
  * @property {Date|null} scheduledTime - When the booking is scheduled for (optional)
  * @property {'pending'|'in_progress'|'completed'|'cancelled'} status - Current booking status
  * @property {string|null} driverId - ID of the assigned driver (if any)
@@ -21,7 +21,7 @@ import { GeoPoint } from '@react-native-firebase/firestore';
  * @property {number} duration - Estimated duration in minutes
  * @property {number} fare - Calculated fare amount
  * @property {Date} createdAt - When the booking was created
- * @property {Date} updatedAt - When the booking was last updated
+ * @property {Date} [updatedAt] - When the booking was last updated (set on updates only)
  */
 
 /**
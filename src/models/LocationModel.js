@@ -9,6 +9,7 @@
  * @property {number} latitude - Latitude coordinate
  * @property {number} longitude - Longitude coordinate
  * @property {string} [geohash] - Geohash for location-based queries
+ * @property {number} [geohash52] - 52-bit integer geohash for range queries
  */
 
 /**